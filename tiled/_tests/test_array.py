@@ -9,7 +9,7 @@ import numpy
 import pytest
 from starlette.status import HTTP_400_BAD_REQUEST, HTTP_406_NOT_ACCEPTABLE
 
-from ..adapters.array import ArrayAdapter
+from ..adapters.array import ArrayAdapter, slice_and_shape_from_block_and_chunks
 from ..adapters.mapping import MapAdapter
 from ..client import Context, from_context
 from ..serialization.array import as_buffer
@@ -170,3 +170,19 @@ def test_array_interface(context):
 def test_as_buffer(kind):
     output = as_buffer(array_cases[kind], {})
     assert len(output) == len(bytes(output))
+
+
+@pytest.mark.parametrize(
+    "chunks", [((3, 3, 2), (5,)), [[3, 3, 2], [5]]], ids=["tuples", "lists"]
+)
+def test_slice_and_shape_from_block_and_chunks(chunks):
+    assert slice_and_shape_from_block_and_chunks((0, 0), chunks) == (
+        (slice(0, 3), slice(0, 5)),
+        (3, 5),
+    )
+    assert slice_and_shape_from_block_and_chunks((2, 0), chunks) == (
+        (slice(6, 8), slice(0, 5)),
+        (2, 5),
+    )
+    with pytest.raises(IndexError):
+        slice_and_shape_from_block_and_chunks((3, 0), chunks)
@@ -6,6 +6,16 @@ from starlette.testclient import TestClient
 from ..adapters.array import ArrayAdapter
 from ..adapters.mapping import MapAdapter
 from ..server.app import build_app
+from ..server.compression import CompressionResponder
+
+
+def noisy_middle():
+    "Mostly zeros, compressible overall, but with noise around the middle."
+    array = numpy.zeros((1000, 1000), dtype="uint8")
+    array[400:600] = numpy.random.default_rng(0).integers(
+        0, 256, size=(200, 1000), dtype="uint8"
+    )
+    return array
 
 
 @pytest.fixture
@@ -15,7 +25,13 @@ def app():
         {
             "compresses_well": ArrayAdapter.from_array(
                 numpy.zeros((1000, 1000)), metadata=metadata
-            )
+            ),
+            "compresses_poorly": ArrayAdapter.from_array(
+                numpy.random.default_rng(0).integers(
+                    0, 256, size=(1000, 1000), dtype="uint8"
+                )
+            ),
+            "noisy_middle": ArrayAdapter.from_array(noisy_middle()),
         },
     )
     return build_app(tree, authentication={"single_user_api_key": "secret"})
@@ -49,3 +65,123 @@ def test_zstd_preferred(app):
     assert data_response.status_code == HTTP_200_OK
     assert "zstd" in metadata_response.headers["Content-Encoding"]
     assert "zstd" in data_response.headers["Content-Encoding"]
+
+
+def test_incompressible_sent_uncompressed(app):
+    with TestClient(app=app) as client:
+        client.headers["Authorization"] = "Apikey secret"
+        client.headers["Accept-Encoding"] = "zstd"
+        data_response = client.get(
+            "/api/v1/array/full/compresses_poorly",
+            headers={"Accept": "application/octet-stream"},
+        )
+    assert data_response.status_code == HTTP_200_OK
+    assert "Content-Encoding" not in data_response.headers
+    assert len(data_response.content) == 1000 * 1000
+
+
+@pytest.fixture
+def compress_calls(monkeypatch):
+    "Record the bodies that are compressed in full."
+    calls = []
+    compress = CompressionResponder.compress
+
+    def spy(self, body):
+        calls.append(len(body))
+        return compress(self, body)
+
+    monkeypatch.setattr(CompressionResponder, "compress", spy)
+    return calls
+
+
+def test_incompressible_not_compressed_in_full(app, compress_calls):
+    # The sample probe rejects high-entropy data before the full body is
+    # compressed, rather than compressing it only to discard the result.
+    with TestClient(app=app) as client:
+        client.headers["Authorization"] = "Apikey secret"
+        client.headers["Accept-Encoding"] = "zstd"
+        data_response = client.get(
+            "/api/v1/array/full/compresses_poorly",
+            headers={"Accept": "application/octet-stream"},
+        )
+    assert data_response.status_code == HTTP_200_OK
+    assert "Content-Encoding" not in data_response.headers
+    assert "compress" not in data_response.headers.get("Server-Timing", "")
+    assert compress_calls == []
+
+
+def test_compressible_compressed_in_full(app, compress_calls):
+    with TestClient(app=app) as client:
+        client.headers["Authorization"] = "Apikey secret"
+        client.headers["Accept-Encoding"] = "zstd"
+        data_response = client.get(
+            "/api/v1/array/full/compresses_well",
+            headers={"Accept": "application/octet-stream"},
+        )
+    assert data_response.status_code == HTTP_200_OK
+    assert "zstd" in data_response.headers["Content-Encoding"]
+    assert compress_calls == [1000 * 1000 * 8]
+
+
+def test_noisy_middle_compressed_in_full(app, compress_calls):
+    # Only the middle of this body is noisy. The probe samples the head and
+    # tail too, so the body is still compressed.
+    body = noisy_middle().tobytes()
+    with TestClient(app=app) as client:
+        client.headers["Authorization"] = "Apikey secret"
+        client.headers["Accept-Encoding"] = "zstd"
+        data_response = client.get(
+            "/api/v1/array/full/noisy_middle",
+            headers={"Accept": "application/octet-stream"},
+        )
+    assert data_response.status_code == HTTP_200_OK
+    assert "zstd" in data_response.headers["Content-Encoding"]
+    assert "compress" in data_response.headers["Server-Timing"]
+    assert compress_calls == [len(body)]
+    assert data_response.content == body
+
+
+@pytest.fixture
+def blosc2_env(monkeypatch):
+    "Set TILED_BLOSC2_* variables, discarding any cached parsing of them."
+    pytest.importorskip("blosc2")
+    from ..media_type_registration import get_blosc2_kwargs
+
+    get_blosc2_kwargs.cache_clear()
+    yield monkeypatch.setenv
+    get_blosc2_kwargs.cache_clear()
+
+
+def test_blosc2_invalid_codec(blosc2_env):
+    from ..media_type_registration import get_blosc2_kwargs
+
+    blosc2_env("TILED_BLOSC2_CODEC", "lz5")
+    with pytest.raises(ValueError, match="TILED_BLOSC2_CODEC.*zstd"):
+        get_blosc2_kwargs()
+
+
+def test_blosc2_clevel_out_of_range(blosc2_env):
+    from ..media_type_registration import get_blosc2_kwargs
+
+    blosc2_env("TILED_BLOSC2_CLEVEL", "10")
+    with pytest.raises(ValueError, match="TILED_BLOSC2_CLEVEL"):
+        get_blosc2_kwargs()
+
+
+def test_blosc2_nthreads_applied_at_startup(app, blosc2_env, monkeypatch):
+    import blosc2
+
+    calls = []
+    monkeypatch.setattr(blosc2, "set_nthreads", calls.append)
+    blosc2_env("TILED_BLOSC2_NTHREADS", "2")
+    with TestClient(app=app):
+        pass
+    assert calls == [2]
+
+
+@pytest.mark.parametrize("nthreads", ["0", "two"])
+def test_blosc2_invalid_nthreads(app, blosc2_env, nthreads):
+    blosc2_env("TILED_BLOSC2_NTHREADS", nthreads)
+    with pytest.raises(ValueError, match="TILED_BLOSC2_NTHREADS"):
+        with TestClient(app=app):
+            pass
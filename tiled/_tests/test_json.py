@@ -33,3 +33,10 @@ def test_nested_ndarray(test_params):
         ]
     }
     safe_json_dump(example_nested_data)
+
+
+def test_non_str_keys():
+    content = {1: "a", "b": {2.5: "c"}}
+    with pytest.raises(TypeError):
+        safe_json_dump(content)
+    assert safe_json_dump(content, stringify_keys=True) == b'{"1":"a","b":{"2.5":"c"}}'
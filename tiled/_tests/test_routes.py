@@ -1,3 +1,4 @@
+import msgpack
 import pytest
 from httpx import ASGITransport, AsyncClient
 from starlette.status import HTTP_200_OK
@@ -12,3 +13,21 @@ async def test_meta_routes(path):
     async with AsyncClient(transport=transport, base_url="http://test") as client:
         response = await client.get(path)
     assert response.status_code == HTTP_200_OK
+
+
+@pytest.mark.parametrize(
+    "accept",
+    [
+        "application/x-msgpack",
+        "application/x-msgpack,application/json",
+        "application/x-msgpack;q=1.0, application/json;q=0.9",
+    ],
+)
+@pytest.mark.asyncio
+async def test_msgpack_negotiation(accept):
+    transport = ASGITransport(app=build_app({}))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/v1/", headers={"Accept": accept})
+    assert response.status_code == HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-msgpack"
+    assert "library_version" in msgpack.unpackb(response.content)
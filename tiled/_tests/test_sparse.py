@@ -6,6 +6,7 @@ from ..adapters.mapping import MapAdapter
 from ..adapters.sparse import COOAdapter
 from ..client import Context, from_context
 from ..server.app import build_app
+from ..structures.sparse import COOStructure
 
 N, M = 3, 5
 state = numpy.random.RandomState(0)
@@ -69,3 +70,19 @@ def test_sparse_multi_chunk(client):
     assert sc.ndim == a.ndim
     assert sc.chunks == chunks
     assert sc.dims == dims
+
+
+def test_narrow_coords_dtype():
+    # Block-local coords in a narrow dtype must be widened before the block
+    # offsets are added, or the second block's coords would overflow.
+    coords = numpy.array([[1], [250]], dtype=numpy.uint8)
+    structure = COOStructure(
+        dims=None, shape=(2, 600), chunks=((2,), (300, 300)), resizable=False
+    )
+    adapter = COOAdapter(
+        {(0, 0): (coords, numpy.array([1.0])), (0, 1): (coords, numpy.array([2.0]))},
+        structure,
+    )
+    arr = adapter.read()
+    assert arr.coords.tolist() == [[1, 1], [250, 550]]
+    assert arr.data.tolist() == [1.0, 2.0]
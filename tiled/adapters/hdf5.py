@@ -356,10 +356,9 @@ class HDF5Adapter(MappingType[str, Union["HDF5Adapter", ArrayAdapter]], Indexers
         -------
 
         """
-        items = [(key, self[key]) for key in list(self)]
-        if direction < 0:
-            items = list(reversed(items))
-        return items[start:stop]
+        # Slice the keys first so that only the requested children are
+        # constructed, rather than one adapter per child in the group.
+        return [(key, self[key]) for key in self._keys_slice(start, stop, direction)]
 
     def inlined_contents_enabled(self, depth: int) -> bool:
         """
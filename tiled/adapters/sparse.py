@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional, Tuple, Union
+import itertools
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import dask
 import numpy
@@ -13,6 +14,52 @@ from .array import slice_and_shape_from_block_and_chunks
 from .protocols import AccessPolicy
 
 
+def chunk_offsets(chunks: Tuple[Tuple[int, ...], ...]) -> List[List[int]]:
+    """
+    Given dask-like chunks, return the starting offset of each block along each dimension.
+    Parameters
+    ----------
+    chunks :
+
+    Returns
+    -------
+
+    """
+    return [list(itertools.accumulate(c[:-1], initial=0)) for c in chunks]
+
+
+def concatenate_block_coords(
+    block_coords: Iterable[Tuple[Tuple[int, ...], NDArray[Any]]],
+    chunks: Tuple[Tuple[int, ...], ...],
+) -> NDArray[Any]:
+    """
+    Concatenate per-block coords, shifted into the global reference frame.
+
+    Parameters
+    ----------
+    block_coords : iterable of (block, coords), coords local to each block
+    chunks :
+
+    Returns
+    -------
+
+    """
+    offsets = chunk_offsets(chunks)
+    blocks, all_coords = zip(*block_coords)
+    # Widen narrow (e.g. uint8) local coords so that the offsets fit.
+    dtype = numpy.result_type(*all_coords, numpy.intp)
+    global_coords = numpy.concatenate(all_coords, axis=-1, dtype=dtype)
+    # Shift each block's coords in place, rather than allocating a shifted
+    # copy per block before concatenating.
+    stop = 0
+    for block, coords in zip(blocks, all_coords):
+        start, stop = stop, stop + coords.shape[-1]
+        global_coords[:, start:stop] += numpy.array(
+            [o[b] for o, b in zip(offsets, block)], dtype=dtype
+        )[:, numpy.newaxis]
+    return global_coords
+
+
 class COOAdapter:
     "Wrap sparse Coordinate List (COO) arrays."
     structure_family = StructureFamily.sparse
@@ -121,13 +168,10 @@ class COOAdapter:
         -------
 
         """
+        offsets = chunk_offsets(chunks)
         local_blocks = {}
         for block, (coords, data) in blocks.items():
-            offsets = []
-            for b, c in zip(block, chunks):
-                offset = sum(c[:b])
-                offsets.append(offset)
-            local_coords = coords - [[i] for i in offsets]
+            local_coords = coords - [[o[b]] for o, b in zip(offsets, block)]
             local_blocks[block] = local_coords, data
         structure = COOStructure(
             dims=dims,
@@ -221,16 +265,11 @@ class COOAdapter:
         all_coords = []
         all_data = []
         for block, (coords, data) in self.blocks.items():
-            offsets = []
-            for b, c in zip(block, self._structure.chunks):
-                offset = sum(c[:b])
-                offsets.append(offset)
-            global_coords = coords + [[i] for i in offsets]
-            all_coords.append(global_coords)
+            all_coords.append((block, coords))
             all_data.append(data)
         arr = sparse.COO(
             data=numpy.concatenate(all_data),
-            coords=numpy.concatenate(all_coords, axis=-1),
+            coords=concatenate_block_coords(all_coords, self._structure.chunks),
             shape=self._structure.shape,
         )
         if slice:
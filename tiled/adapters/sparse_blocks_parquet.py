@@ -15,6 +15,7 @@ from ..structures.sparse import COOStructure
 from ..type_aliases import JSON, NDSlice
 from ..utils import path_from_uri
 from .protocols import AccessPolicy
+from .sparse import concatenate_block_coords
 
 
 def load_block(uri: str) -> Tuple[List[int], Tuple[NDArray[Any], Any]]:
@@ -154,16 +155,11 @@ class SparseBlocksParquetAdapter:
         all_data = []
         for block, uri in self.blocks.items():
             coords, data = load_block(uri)
-            offsets = []
-            for b, c in zip(block, self.structure().chunks):
-                offset = sum(c[:b])
-                offsets.append(offset)
-            global_coords = coords + [[i] for i in offsets]
-            all_coords.append(global_coords)
+            all_coords.append((block, coords))
             all_data.append(data)
         arr = sparse.COO(
             data=numpy.concatenate(all_data),
-            coords=numpy.concatenate(all_coords, axis=-1),
+            coords=concatenate_block_coords(all_coords, self.structure().chunks),
             shape=self._structure.shape,
         )
         return arr[slice]
@@ -133,9 +133,10 @@ class ZarrArrayAdapter(ArrayAdapter):
         block_slice, _ = slice_and_shape_from_block_and_chunks(
             block, self.structure().chunks
         )
-        # Slice the block out of the whole array,
-        # and optionally a sub-slice therein.
-        return self._array[self._stencil()][block_slice][slice]
+        # Slice the block out of the whole array, and optionally a sub-slice
+        # therein. The block lies within the (trimmed) shape, so there is no
+        # need to apply the stencil, which would read the entire array.
+        return self._array[block_slice][slice]
 
     def write(
         self,
@@ -447,10 +448,9 @@ class ZarrGroupAdapter(
         -------
 
         """
-        items = [(key, self[key]) for key in list(self)]
-        if direction < 0:
-            items = list(reversed(items))
-        return items[start:stop]
+        # Slice the keys first so that only the requested children are
+        # constructed, rather than one adapter per child in the group.
+        return [(key, self[key]) for key in self._keys_slice(start, stop, direction)]
 
     def inlined_contents_enabled(self, depth: int) -> bool:
         """
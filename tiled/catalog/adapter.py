@@ -1397,8 +1397,8 @@ def from_uri(
         # Capture stdout and stderr from the subprocess and write to logging
         stdout = process.stdout.decode()
         stderr = process.stderr.decode()
-        logger.info(f"Subprocess stdout: {stdout}")
-        logger.info(f"Subprocess stderr: {stderr}")
+        logger.info("Subprocess stdout: %s", stdout)
+        logger.info("Subprocess stderr: %s", stderr)
 
     parsed_url = make_url(uri)
     if (parsed_url.get_dialect().name == "sqlite") and (
@@ -1,6 +1,9 @@
 import collections
+import functools
 import gzip
 import mimetypes
+import os
+import threading
 from collections import defaultdict
 
 from .utils import (
@@ -236,12 +239,22 @@ for media_type in [
 if modules_available("zstandard"):
     import zstandard
 
-    # These defaults are cribbed from
-    # https://docs.dask.org/en/latest/configuration-reference.html
-    # TODO Make compression settings configurable.
-    # This complex in our case because, as with gzip, we may
-    # want configure differently for different media types.
-    zstd_compressor = zstandard.ZstdCompressor(level=3, threads=0)
+    # ZstdCompressor instances are not thread-safe, so each thread that
+    # compresses responses gets its own (reused) instance.
+    _zstd_local = threading.local()
+
+    def _get_zstd_compressor():
+        try:
+            return _zstd_local.compressor
+        except AttributeError:
+            # These defaults are cribbed from
+            # https://docs.dask.org/en/latest/configuration-reference.html
+            # TODO Make these configurable, as the blosc2 settings are.
+            # This complex in our case because, as with gzip, we may
+            # want configure differently for different media types.
+            compressor = zstandard.ZstdCompressor(level=3, threads=0)
+            _zstd_local.compressor = compressor
+            return compressor
 
     class ZstdBuffer:
         """
@@ -255,7 +268,7 @@ if modules_available("zstandard"):
             self._file = file
 
         def write(self, b):
-            self._file.write(zstd_compressor.compress(b))
+            self._file.write(_get_zstd_compressor().compress(b))
 
         def close(self):
             pass
@@ -331,6 +344,49 @@ if modules_available("lz4"):
 if modules_available("blosc2"):
     import blosc2
 
+    @functools.lru_cache(maxsize=1)
+    def get_blosc2_kwargs():
+        """
+        Read blosc2 compression parameters from the environment.
+
+        For example, TILED_BLOSC2_CODEC=zstd TILED_BLOSC2_CLEVEL=1. Any left
+        unset use the blosc2 defaults. This is read lazily, on first use, so
+        that merely importing tiled (as the client does) never fails on it.
+        """
+        kwargs = {}
+        if codec := os.getenv("TILED_BLOSC2_CODEC"):
+            try:
+                kwargs["codec"] = blosc2.Codec[codec.upper()]
+            except KeyError:
+                valid = ", ".join(c.name.lower() for c in blosc2.Codec)
+                raise ValueError(
+                    f"TILED_BLOSC2_CODEC={codec!r} is not a known blosc2 codec. "
+                    f"Valid codecs are: {valid}"
+                ) from None
+        if clevel := os.getenv("TILED_BLOSC2_CLEVEL"):
+            if not (clevel.isdigit() and 0 <= int(clevel) <= 9):
+                raise ValueError(
+                    f"TILED_BLOSC2_CLEVEL={clevel!r} must be an integer from 0 to 9."
+                )
+            kwargs["clevel"] = int(clevel)
+        return kwargs
+
+    def get_blosc2_nthreads():
+        """
+        Read the number of blosc2 compression threads from the environment.
+
+        This is TILED_BLOSC2_NTHREADS, or None if it is unset, in which case
+        blosc2 uses its default (every core). The server applies it at startup,
+        so that merely importing tiled never alters blosc2's global state.
+        """
+        if nthreads := os.getenv("TILED_BLOSC2_NTHREADS"):
+            if not (nthreads.isdigit() and int(nthreads) >= 1):
+                raise ValueError(
+                    f"TILED_BLOSC2_NTHREADS={nthreads!r} must be a positive integer."
+                )
+            return int(nthreads)
+        return None
+
     class BloscBuffer:
         """
         Imitate the API provided by gzip.GzipFile and used by tiled.server.compression.
@@ -346,9 +402,11 @@ if modules_available("blosc2"):
             if hasattr(b, "itemsize"):
                 # This could be memoryview or numpy.ndarray, for example.
                 # Blosc uses item-aware shuffling for improved results.
-                compressed = blosc2.compress(b, typesize=b.itemsize)
+                compressed = blosc2.compress(
+                    b, typesize=b.itemsize, **get_blosc2_kwargs()
+                )
             else:
-                compressed = blosc2.compress(b)
+                compressed = blosc2.compress(b, **get_blosc2_kwargs())
             self._file.write(compressed)
 
         def close(self):
@@ -67,9 +67,12 @@ if modules_available("PIL"):
         # *many* because it depends on the shape (RGB, RGBA, etc.)
         array = numpy.atleast_2d(array).astype(numpy.float32)
         # Auto-scale. TODO Use percentile.
-        low = numpy.percentile(array.ravel(), 1)
-        high = numpy.percentile(array.ravel(), 99)
-        scaled_array = numpy.clip((array - low) / (high - low), 0, 1)
+        low, high = numpy.percentile(array, [1, 99])
+        # astype() gave us a fresh copy, so scale it in place rather than
+        # allocating a new temporary array at each step.
+        array -= low
+        array /= high - low
+        scaled_array = numpy.clip(array, 0, 1, out=array)
         file = io.BytesIO()
         try:
             prepared_array = img_as_ubyte(scaled_array)
@@ -39,7 +39,13 @@ from ..config import construct_build_app_kwargs
 from ..media_type_registration import (
     compression_registry as default_compression_registry,
 )
-from ..utils import SHARE_TILED_PATH, Conflicts, SpecialUsers, UnsupportedQueryType
+from ..utils import (
+    SHARE_TILED_PATH,
+    Conflicts,
+    SpecialUsers,
+    UnsupportedQueryType,
+    modules_available,
+)
 from ..validation_registration import validation_registry as default_validation_registry
 from . import schemas
 from .authentication import get_current_principal
@@ -69,6 +75,14 @@ CSRF_QUERY_PARAMETER = "csrf"
 
 MINIMUM_SUPPORTED_PYTHON_CLIENT_VERSION = packaging.version.parse("0.1.0a104")
 
+
+@lru_cache(maxsize=128)
+def parse_client_version(raw_version):
+    # Every request from the Python client reports its version, and a given
+    # server sees only a handful of distinct versions, so cache the parsing.
+    return packaging.version.parse(raw_version)
+
+
 logger = logging.getLogger(__name__)
 logger.setLevel("INFO")
 handler = logging.StreamHandler()
@@ -489,7 +503,7 @@ or via the environment variable TILED_SINGLE_USER_API_KEY.""",
     async def startup_event():
         from .. import __version__
 
-        logger.info(f"Tiled version {__version__}")
+        logger.info("Tiled version %s", __version__)
         # Validate the single-user API key.
         settings = app.dependency_overrides[get_settings]()
         single_user_api_key = settings.single_user_api_key
@@ -522,6 +536,21 @@ confusing behavior due to ambiguous encodings.
                     + API_KEY_MSG
                 )
 
+        if modules_available("blosc2"):
+            import blosc2
+
+            from ..media_type_registration import (
+                get_blosc2_kwargs,
+                get_blosc2_nthreads,
+            )
+
+            # Fail now, rather than on the first blosc2-compressed response,
+            # if the blosc2 environment variables are invalid.
+            get_blosc2_kwargs()
+            nthreads = get_blosc2_nthreads()
+            if nthreads is not None:
+                blosc2.set_nthreads(nthreads)
+
         # Run startup tasks collected from trees (adapters).
         for task in tasks.get("startup", []):
             await task()
@@ -623,10 +652,10 @@ Back up the database, and then run:
                     )
                     raise err from None
                 else:
-                    logger.info(f"Connected to existing database at {redacted_url}.")
+                    logger.info("Connected to existing database at %s.", redacted_url)
             for admin in authentication.get("tiled_admins", []):
                 logger.info(
-                    f"Ensuring that principal with identity {admin} has role 'admin'"
+                    "Ensuring that principal with identity %s has role 'admin'", admin
                 )
                 async with AsyncSession(
                     engine, autoflush=False, expire_on_commit=False
@@ -648,14 +677,16 @@ Back up the database, and then run:
                         )
                         if num_expired_sessions:
                             logger.info(
-                                f"Purged {num_expired_sessions} expired Sessions from the database."
+                                "Purged %d expired Sessions from the database.",
+                                num_expired_sessions,
                             )
                         num_expired_api_keys = await purge_expired(
                             db_session, orm.APIKey
                         )
                         if num_expired_api_keys:
                             logger.info(
-                                f"Purged {num_expired_api_keys} expired API keys from the database."
+                                "Purged %d expired API keys from the database.",
+                                num_expired_api_keys,
                             )
                     await asyncio.sleep(PURGE_INTERVAL)
 
@@ -727,15 +758,14 @@ Back up the database, and then run:
         if user_agent.startswith("python-tiled/"):
             agent, _, raw_version = user_agent.partition("/")
             try:
-                parsed_version = packaging.version.parse(raw_version)
-            except Exception as caught_exception:
+                parsed_version = parse_client_version(raw_version)
+            except packaging.version.InvalidVersion:
                 invalid_version_message = (
                     f"Python Tiled client version is reported as {raw_version}. "
                     "This cannot be parsed as a valid version."
                 )
                 logger.warning(invalid_version_message)
-                if isinstance(caught_exception, packaging.version.InvalidVersion):
-                    warnings.warn(invalid_version_message)
+                warnings.warn(invalid_version_message)
             else:
                 if (not parsed_version.is_devrelease) and (
                     parsed_version < MINIMUM_SUPPORTED_PYTHON_CLIENT_VERSION
@@ -906,7 +936,7 @@ def app_factory():
     example) where only a module and instance or factory can be specified.
     """
     config_path = os.getenv("TILED_CONFIG", "config.yml")
-    logger.info(f"Using configuration from {Path(config_path).absolute()}")
+    logger.info("Using configuration from %s", Path(config_path).absolute())
 
     from ..config import construct_build_app_kwargs, parse_configs
 
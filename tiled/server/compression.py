@@ -1,9 +1,25 @@
 import io
 import time
 
+import anyio
 from starlette.datastructures import Headers, MutableHeaders
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+# Bodies larger than this are compressed on a worker thread so that the event
+# loop can keep serving other requests in the meantime. (The compression
+# libraries release the GIL.) Smaller bodies are not worth the hand-off.
+THREADED_COMPRESSION_SIZE = 1024 * 1024  # bytes
+# If compression does not achieve at least this ratio, send the original; the
+# savings isn't worth the decompression time.
+COMPRESSION_RATIO_THRESHOLD = 1 / 0.9
+# Large bodies are first probed by compressing samples of this size from the
+# head, middle, and tail, so that incompressible (e.g. high-entropy) data is
+# not compressed in full only to be thrown away.
+COMPRESSION_SAMPLE_SIZE = 64 * 1024  # bytes
+# Bodies smaller than this are not probed; they are cheap enough to compress
+# in full.
+COMPRESSION_PROBE_MINIMUM_SIZE = 4 * COMPRESSION_SAMPLE_SIZE  # bytes
+
 
 class CompressionMiddleware:
     def __init__(
@@ -47,6 +63,28 @@ class CompressionResponder:
         self.scope = scope
         await self.app(scope, receive, self.send_compressed)
 
+    def compress(self, body: bytes) -> None:
+        self.compressed_file.write(body)
+        self.compressed_file.close()
+
+    def sample_compresses_well(self, body: bytes) -> bool:
+        if len(body) < COMPRESSION_PROBE_MINIMUM_SIZE:
+            # Not worth probing; just try compressing the whole body.
+            return True
+        # Data is often compressible only in places (e.g. a noisy region of
+        # interest surrounded by zero padding), so compress the whole body
+        # if any one of the samples compresses well.
+        last = len(body) - COMPRESSION_SAMPLE_SIZE
+        for start in (0, last // 2, last):
+            sample = body[start : start + COMPRESSION_SAMPLE_SIZE]  # noqa: E203
+            buffer = io.BytesIO()
+            file = self.file_factory(buffer)
+            file.write(sample)
+            file.close()
+            if len(sample) / len(buffer.getvalue()) > COMPRESSION_RATIO_THRESHOLD:
+                return True
+        return False
+
     async def send_compressed(self, message: Message) -> None:
         message_type = message["type"]
         if message_type == "http.response.start":
@@ -63,6 +101,7 @@ class CompressionResponder:
                     )
                     self.compressed_buffer = io.BytesIO()
                     self.compressed_file = file_factory(self.compressed_buffer)
+                    self.file_factory = file_factory
                     self.encoding = encoding
                     break
             else:
@@ -77,20 +116,21 @@ class CompressionResponder:
                 await self.send(self.initial_message)
                 await self.send(message)
             elif not more_body:
-                if self.encoding is not None:
+                # The reported compression time includes the time spent probing.
+                t0 = time.perf_counter()
+                if (self.encoding is not None) and self.sample_compresses_well(body):
                     # Standard (non-streaming) response.
-                    t0 = time.perf_counter()
-                    self.compressed_file.write(body)
-                    self.compressed_file.close()
+                    if len(body) > THREADED_COMPRESSION_SIZE:
+                        await anyio.to_thread.run_sync(self.compress, body)
+                    else:
+                        self.compress(body)
                     compression_time = time.perf_counter() - t0
                     compressed_body = self.compressed_buffer.getvalue()
                     # Check to see if the compression ratio is significant.
-                    # If it isn't just send the original; the savings isn't worth the decompression time.
                     compression_ratio = len(body) / len(
                         compressed_body
                     )  # higher is better
-                    THRESHOLD = 1 / 0.9
-                    if compression_ratio > THRESHOLD:
+                    if compression_ratio > COMPRESSION_RATIO_THRESHOLD:
                         headers["Content-Encoding"] = self.encoding
                         headers["Content-Length"] = str(len(compressed_body))
                         headers.add_vary_header("Accept-Encoding")
@@ -78,8 +78,9 @@ async def len_or_approx(tree):
 
 def pagination_links(base_url, route, path_parts, offset, limit, length_hint):
     path_str = "/".join(path_parts)
+    prefix = f"{base_url}{route}/{path_str}?page[offset]="
     links = {
-        "self": f"{base_url}{route}/{path_str}?page[offset]={offset}&page[limit]={limit}",
+        "self": f"{prefix}{offset}&page[limit]={limit}",
         # These are conditionally overwritten below.
         "first": None,
         "last": None,
@@ -90,18 +91,14 @@ def pagination_links(base_url, route, path_parts, offset, limit, length_hint):
         last_page = math.floor(length_hint / limit) * limit
         links.update(
             {
-                "first": f"{base_url}{route}/{path_str}?page[offset]={0}&page[limit]={limit}",
-                "last": f"{base_url}{route}/{path_str}?page[offset]={last_page}&page[limit]={limit}",
+                "first": f"{prefix}{0}&page[limit]={limit}",
+                "last": f"{prefix}{last_page}&page[limit]={limit}",
             }
         )
     if offset + limit < length_hint:
-        links[
-            "next"
-        ] = f"{base_url}{route}/{path_str}?page[offset]={offset + limit}&page[limit]={limit}"
+        links["next"] = f"{prefix}{offset + limit}&page[limit]={limit}"
     if offset > 0:
-        links[
-            "prev"
-        ] = f"{base_url}{route}/{path_str}?page[offset]={max(0, offset - limit)}&page[limit]={limit}"
+        links["prev"] = f"{prefix}{max(0, offset - limit)}&page[limit]={limit}"
     return links
 
 
@@ -378,12 +375,12 @@ async def construct_data_response(
             content = await ensure_awaitable(serializer, payload, metadata)
     except UnsupportedShape as err:
         raise UnsupportedMediaTypes(
-            f"The shape of this data {err.args[0]} is incompatible with the requested format ({media_type}). "
+            f"The shape of this data {err} is incompatible with the requested format ({media_type}). "
             f"Slice it or choose a different format.",
         )
     except SerializationError as err:
         raise UnsupportedMediaTypes(
-            f"This type is supported in general but there was an error packing this specific data: {err.args[0]}",
+            f"This type is supported in general but there was an error packing this specific data: {err}",
         )
     if isinstance(content, types.GeneratorType):
         response_class = StreamingResponse
@@ -518,19 +515,20 @@ async def construct_resource(
             ResourceLinksT = schemas.resource_links_type_by_structure_family[
                 entry.structure_family
             ]
+            structure = entry.structure()
             links.update(
                 links_for_node(
                     entry.structure_family,
-                    entry.structure(),
+                    structure,
                     base_url,
                     path_str,
                 )
             )
-            structure = asdict(entry.structure())
             if schemas.EntryFields.structure_family in fields:
                 attributes["structure_family"] = entry.structure_family
             if schemas.EntryFields.structure in fields:
-                attributes["structure"] = structure
+                # Only pay for the (deep-copying) conversion if it is requested.
+                attributes["structure"] = asdict(structure)
 
         else:
             # We only have entry names, not structure_family, so
@@ -554,7 +552,7 @@ class NumpySafeJSONResponse(JSONResponse):
 
     def render(self, content: Any) -> bytes:
         with record_timing(self.__metrics, "pack"):
-            return safe_json_dump(content)
+            return safe_json_dump(content, stringify_keys=True)
 
 
 def _fallback_msgpack_encoder(obj):
@@ -627,7 +625,13 @@ HTTP_EXPIRES_HEADER_FORMAT = "%a, %d %b %Y %H:%M:%S GMT"
 
 
 def resolve_media_type(request):
-    media_types = request.headers.get("Accept", JSON_MIME_TYPE).split(", ")
+    # As in construct_data_response, tolerate "," as well as ", " separators.
+    # Also drop any parameters, as in "application/x-msgpack;q=0.9", so that
+    # clients that send them still get the more compact msgpack encoding.
+    media_types = [
+        s.split(";", 1)[0].strip()
+        for s in request.headers.get("Accept", JSON_MIME_TYPE).split(",")
+    ]
     for media_type in media_types:
         if media_type == "*/*":
             media_type = JSON_MIME_TYPE
@@ -3,6 +3,8 @@ Generate the 'links' section of the response JSON.
 
 The links vary by structure family.
 """
+import functools
+
 from ..structures.core import StructureFamily
 
 
@@ -15,9 +17,15 @@ def links_for_node(structure_family, structure, base_url, path_str):
     return links
 
 
+@functools.lru_cache(maxsize=32)
+def _block_template(ndim):
+    # e.g. "{0},{1},{2}" for ndim=3
+    return ",".join(f"{{{index}}}" for index in range(ndim))
+
+
 def links_for_array(structure_family, structure, base_url, path_str):
     links = {}
-    block_template = ",".join(f"{{{index}}}" for index in range(len(structure.shape)))
+    block_template = _block_template(len(structure.shape))
     links["block"] = f"{base_url}/array/block/{path_str}?block={block_template}"
     links["full"] = f"{base_url}/array/full/{path_str}"
     return links
@@ -9,7 +9,9 @@ from pathlib import Path
 from typing import Any, List, Optional
 
 import anyio
+import numpy
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Security
+from fastapi.responses import ORJSONResponse
 from jmespath.exceptions import JMESPathError
 from json_merge_patch import merge as apply_merge_patch
 from jsonpatch import apply_patch as apply_json_patch
@@ -64,7 +66,10 @@ from .links import links_for_node
 from .settings import get_settings
 from .utils import filter_for_access, get_base_url, record_timing
 
-router = APIRouter()
+# Routes here build and return a Response directly (see json_or_msgpack),
+# which bypasses FastAPI's jsonable_encoder walk over the content. If a route
+# returns plain data instead, serialize it with orjson rather than json.
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.get("/", response_model=schemas.About)
@@ -456,10 +461,6 @@ async def array_full(
     Fetch a slice of array-like data.
     """
     structure_family = entry.structure_family
-    # Deferred import because this is not a required dependency of the server
-    # for some use cases.
-    import numpy
-
     try:
         with record_timing(request.state.metrics, "read"):
             array = await ensure_awaitable(entry.read, slice)
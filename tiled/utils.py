@@ -523,33 +523,50 @@ def prepend_to_sys_path(*paths):
             sys.path.pop(0)
 
 
-def safe_json_dump(content):
+def _safe_json_default(content):
+    if isinstance(content, bytes):
+        content = f"data:application/octet-stream;base64,{base64.b64encode(content).decode('utf-8')}"
+        return content
+    if isinstance(content, Path):
+        return str(content)
+    # No need to import numpy if it hasn't been used already.
+    numpy = sys.modules.get("numpy", None)
+    if numpy is not None:
+        if isinstance(content, numpy.ndarray):
+            # If we make it here, OPT_NUMPY_SERIALIZE failed because we have hit some edge case.
+            # Give up on the numpy fast-path and convert to Python list.
+            # If the items in this list aren't serializable (e.g. bytes) we'll recurse on each item.
+            return content.tolist()
+        elif isinstance(content, (bytes, numpy.bytes_)):
+            return content.decode("utf-8")
+    raise TypeError
+
+
+def safe_json_dump(content, stringify_keys=False):
     """
     Baes64-encode raw bytes, and provide a fallback if orjson numpy handling fails.
+
+    If stringify_keys is True, dicts with non-str keys (e.g. ints in metadata)
+    are retried with their keys stringified, as the stdlib json module does,
+    rather than rejected.
     """
     import orjson
 
-    def default(content):
-        if isinstance(content, bytes):
-            content = f"data:application/octet-stream;base64,{base64.b64encode(content).decode('utf-8')}"
-            return content
-        if isinstance(content, Path):
-            return str(content)
-        # No need to import numpy if it hasn't been used already.
-        numpy = sys.modules.get("numpy", None)
-        if numpy is not None:
-            if isinstance(content, numpy.ndarray):
-                # If we make it here, OPT_NUMPY_SERIALIZE failed because we have hit some edge case.
-                # Give up on the numpy fast-path and convert to Python list.
-                # If the items in this list aren't serializable (e.g. bytes) we'll recurse on each item.
-                return content.tolist()
-            elif isinstance(content, (bytes, numpy.bytes_)):
-                return content.decode("utf-8")
-        raise TypeError
-
     # Not all numpy dtypes are supported by orjson.
     # Fall back to converting to a (possibly nested) Python list.
-    return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY, default=default)
+    try:
+        return orjson.dumps(
+            content, option=orjson.OPT_SERIALIZE_NUMPY, default=_safe_json_default
+        )
+    except TypeError as err:
+        # Only pay for OPT_NON_STR_KEYS when it is needed.
+        if not (stringify_keys and str(err) == "Dict key must be str"):
+            raise
+    return orjson.dumps(
+        content,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        default=_safe_json_default,
+    )
 
 
 class MissingDependency(ModuleNotFoundError):